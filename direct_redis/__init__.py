@@ -6,8 +6,10 @@ the standard Redis client to automatically handle serialization and deserializat
 of Python objects. It allows for easier storage and retrieval of complex data types
 in Redis, including custom Python objects, without manual encoding and decoding.
 
-The main class provided by this package is:
+The main classes provided by this package are:
     - DirectRedis: An extended Redis client with automatic serialization capabilities.
+    - AsyncDirectRedis: The same client on top of redis.asyncio, for callers that
+      want to overlap many commands on one multiplexed connection.
 
 Usage:
     from direct_redis import DirectRedis
@@ -19,8 +21,13 @@ Usage:
     dr.set('key', {'complex': 'data'})
     data = dr.get('key')  # Returns the deserialized Python dictionary
 
+    # For concurrent workers, share one client built on a bounded pool:
+    dr = DirectRedis.from_url('redis://localhost:6379/0', max_connections=32)
+
 This package simplifies Redis operations when working with complex Python data structures,
 making it easier to integrate Redis into Python applications that deal with non-string data.
 """
 
+from .async_direct_redis import AsyncDirectRedis
 from .direct_redis import DirectRedis
+from .functions import set_compression
@@ -0,0 +1,267 @@
+"""
+AsyncDirectRedis module provides the asyncio counterpart of DirectRedis.
+
+This module extends redis.asyncio.Redis with the same automatic
+serialization and deserialization as the synchronous client, letting
+write-heavy callers submit many commands concurrently over a single
+multiplexed connection.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    from redis.asyncio import BlockingConnectionPool, Redis
+except ImportError:
+    raise ImportError(
+        "Redis is not installed. Please install it using pip install redis"
+    )
+from direct_redis.functions import (
+    convert_set_type,
+    convert_set_mapping_dic,
+    convert_get_type,
+    _batch_decode,
+    _decode_pklfirst,
+    _decode_str,
+    _decode_strfirst,
+)
+
+
+class AsyncDirectRedis(Redis):
+    """
+    AsyncDirectRedis extends redis.asyncio.Redis with automatic serialization.
+
+    The wrapped commands and their conversions match DirectRedis exactly;
+    only the call style differs, so data written by one client is read
+    back identically by the other.
+    """
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        *,
+        max_connections: int = 32,
+        timeout: Optional[float] = 5,
+        **kwargs: Any,
+    ) -> "AsyncDirectRedis":
+        """Return an AsyncDirectRedis client backed by a bounded blocking
+        connection pool created from ``url``.
+
+        At most ``max_connections`` sockets are ever opened; when all of
+        them are busy a caller waits up to ``timeout`` seconds for one to
+        free up instead of growing the connection count without bound.
+        Any further keyword arguments (``db``, ``socket_timeout``, ...)
+        are forwarded to the pool and apply to every connection it
+        creates."""
+        pool = BlockingConnectionPool.from_url(
+            url, max_connections=max_connections, timeout=timeout, **kwargs
+        )
+        return cls(connection_pool=pool)
+
+    async def keys(self, pattern: str = "*", **kwargs: Any) -> List[str]:
+        """Get all keys matching pattern."""
+        encoded = await Redis.keys(self, pattern, **kwargs)
+        return list(map(bytes.decode, encoded or ()))
+
+    async def randomkey(self, **kwargs: Any) -> Optional[str]:
+        """Return a random key from the keyspace."""
+        encoded = await Redis.randomkey(self, **kwargs)
+        return _decode_str(encoded)
+
+    async def type(self, name: str) -> Optional[str]:
+        """Determine the type stored at key."""
+        encoded = await Redis.type(self, name)
+        return _decode_str(encoded)
+
+    async def set(
+        self,
+        name: str,
+        value: Any,
+        ex: Optional[int] = None,
+        px: Optional[int] = None,
+        nx: bool = False,
+        xx: bool = False,
+    ) -> bool:
+        """Set the value at key ``name`` to ``value``"""
+        return await Redis.set(self, name, convert_set_type(value), ex, px, nx, xx)
+
+    async def get(self, name: str, pickle_first: bool = False) -> Any:
+        """Return the value at key ``name``, or None if the key doesn't exist"""
+        encoded = await Redis.get(self, name)
+        return convert_get_type(encoded, pickle_first)
+
+    async def mset(self, mapping: Dict[str, Any]) -> bool:
+        """Set key/values based on a mapping."""
+        if not isinstance(mapping, dict):
+            raise ValueError("mapping must be a python dictionary")
+        mapping = convert_set_mapping_dic(mapping)
+        return await Redis.mset(self, mapping)
+
+    async def mset_fire_and_forget(self, mapping: Dict[str, Any]) -> None:
+        """Set key/values based on a mapping through one non-transactional
+        pipeline flush.
+
+        All SET commands are queued locally and written to the socket in
+        a single batch, so serialization overlaps with Redis handling the
+        earlier commands instead of paying one round-trip per key."""
+        if not isinstance(mapping, dict):
+            raise ValueError("mapping must be a python dictionary")
+        async with self.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, convert_set_type(value))
+            await pipe.execute()
+
+    async def mget(self, *names: str, pickle_first: bool = False) -> List[Any]:
+        """Returns a list of values ordered identically to ``names``
+
+        Accepts either ``mget('a', 'b')`` or ``mget(['a', 'b'])``, like
+        redis-py itself."""
+        if len(names) == 1 and isinstance(names[0], (list, tuple)):
+            names = names[0]
+        encoded = await Redis.mget(self, names)
+        return _batch_decode(encoded, pickle_first)
+
+    async def hkeys(self, name: str) -> List[str]:
+        """Return the list of keys within hash ``name``"""
+        encoded = await Redis.hkeys(self, name)
+        return list(map(bytes.decode, encoded or ()))
+
+    async def hset(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        value: Optional[Any] = None,
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Set ``key`` to ``value`` within hash ``name``"""
+        if mapping:
+            mapping = convert_set_mapping_dic(mapping)
+            return await Redis.hset(self, name, mapping=mapping)
+        return await Redis.hset(self, name, key, convert_set_type(value))
+
+    async def hmset(self, name: str, mapping: Dict[str, Any]) -> bool:
+        """Set key to value within hash ``name``
+        for each corresponding key and value from the ``mapping`` dict."""
+        if not isinstance(mapping, dict):
+            raise ValueError("mapping must be a python dictionary")
+        mapping = convert_set_mapping_dic(mapping)
+        return await Redis.hmset(self, name, mapping)
+
+    async def hget(self, name: str, key: str, pickle_first: bool = False) -> Any:
+        """Return the value of ``key`` within the hash ``name``"""
+        encoded = await Redis.hget(self, name, key)
+        return convert_get_type(encoded, pickle_first)
+
+    async def hmget(
+        self, name: str, keys: List[str], pickle_first: bool = False
+    ) -> List[Any]:
+        """Returns a list of values ordered identically to ``keys``"""
+        encoded = await Redis.hmget(self, name, keys)
+        return _batch_decode(encoded, pickle_first)
+
+    async def hvals(self, name: str, pickle_first: bool = False) -> List[Any]:
+        """Return the list of values within hash ``name``"""
+        encoded = await Redis.hvals(self, name)
+        return _batch_decode(encoded, pickle_first)
+
+    async def hgetall(self, name: str, pickle_first: bool = False) -> Dict[str, Any]:
+        """Return a Python dict of the hash's name/value pairs"""
+        encoded = await Redis.hgetall(self, name)
+        if not encoded:
+            return {}
+        keys = map(bytes.decode, encoded.keys())
+        decoder = _decode_pklfirst if pickle_first else _decode_strfirst
+        return dict(zip(keys, map(decoder, encoded.values())))
+
+    async def sadd(self, name: str, *values: Any) -> int:
+        """Add ``value(s)`` to set ``name``"""
+        return await Redis.sadd(self, name, *map(convert_set_type, values))
+
+    async def srem(self, name: str, *values: Any) -> int:
+        """Remove ``values`` from set ``name``"""
+        return await Redis.srem(self, name, *map(convert_set_type, values))
+
+    async def sismember(self, name: str, value: Any) -> bool:
+        """Return a boolean indicating if ``value`` is a member of set ``name``"""
+        encoded = convert_set_type(value)
+        return await Redis.sismember(self, name, encoded)
+
+    async def smembers(self, name: str, pickle_first: bool = False) -> set:
+        """Return all members of the set ``name``"""
+        encoded = await Redis.smembers(self, name)
+        return set(_batch_decode(encoded, pickle_first))
+
+    async def spop(
+        self, name: str, count: Optional[int] = None, pickle_first: bool = False
+    ) -> Union[Any, List[Any]]:
+        """Remove and return a random member of set ``name``"""
+        encoded = await Redis.spop(self, name, count)
+        if isinstance(encoded, list):
+            return _batch_decode(encoded, pickle_first)
+        return convert_get_type(encoded, pickle_first)
+
+    async def srandmember(
+        self, name: str, number: Optional[int] = None, pickle_first: bool = False
+    ) -> Union[Any, List[Any]]:
+        """Return a random member of set ``name``"""
+        encoded = await Redis.srandmember(self, name, number=number)
+        if isinstance(encoded, list):
+            return _batch_decode(encoded, pickle_first)
+        return convert_get_type(encoded, pickle_first)
+
+    async def sdiff(self, keys: Union[str, List[str]], *args: str) -> set:
+        """Return the difference of sets specified by ``keys``"""
+        encoded = await Redis.sdiff(self, keys, *args)
+        return set(_batch_decode(encoded, pickle_first=False))
+
+    async def lpush(self, name: str, *values: Any) -> int:
+        """Push ``values`` onto the head of the list ``name``"""
+        return await Redis.lpush(self, name, *map(convert_set_type, values))
+
+    async def lpushx(self, name: str, value: Any) -> int:
+        """Push ``value`` onto the head of the list ``name`` if ``name`` exists"""
+        return await Redis.lpushx(self, name, convert_set_type(value))
+
+    async def rpushx(self, name: str, value: Any) -> int:
+        """Push ``value`` onto the tail of the list ``name`` if ``name`` exists"""
+        return await Redis.rpushx(self, name, convert_set_type(value))
+
+    async def rpush(self, name: str, *values: Any) -> int:
+        """Push ``values`` onto the tail of the list ``name``"""
+        return await Redis.rpush(self, name, *map(convert_set_type, values))
+
+    async def lpop(
+        self, name: str, count: Optional[int] = None, pickle_first: bool = False
+    ) -> Union[Any, List[Any]]:
+        """Remove and return the first item of the list ``name``"""
+        encoded = await Redis.lpop(self, name, count)
+        if isinstance(encoded, list):
+            return _batch_decode(encoded, pickle_first)
+        return convert_get_type(encoded, pickle_first)
+
+    async def rpop(
+        self, name: str, count: Optional[int] = None, pickle_first: bool = False
+    ) -> Union[Any, List[Any]]:
+        """Remove and return the last item of the list ``name``"""
+        encoded = await Redis.rpop(self, name, count)
+        if isinstance(encoded, list):
+            return _batch_decode(encoded, pickle_first)
+        return convert_get_type(encoded, pickle_first)
+
+    async def lindex(self, name: str, index: int, pickle_first: bool = False) -> Any:
+        """Return the item from list ``name`` at position ``index``"""
+        encoded = await Redis.lindex(self, name, index)
+        return convert_get_type(encoded, pickle_first)
+
+    async def lrange(
+        self, name: str, start: int = 0, end: int = -1, pickle_first: bool = False
+    ) -> List[Any]:
+        """
+        Return a slice of the list ``name`` between
+        position ``start`` and ``end``
+
+        ``start`` and ``end`` can be negative numbers just like
+        Python slicing notation
+        """
+        encoded = await Redis.lrange(self, name, start, end)
+        return _batch_decode(encoded, pickle_first)
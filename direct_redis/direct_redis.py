@@ -9,7 +9,7 @@ of complex data types.
 from typing import Any, Dict, List, Optional, Union
 
 try:
-    from redis import Redis
+    from redis import BlockingConnectionPool, Redis
 except ImportError:
     raise ImportError(
         "Redis is not installed. Please install it using pip install redis"
@@ -18,6 +18,10 @@ from direct_redis.functions import (
     convert_set_type,
     convert_set_mapping_dic,
     convert_get_type,
+    _batch_decode,
+    _decode_pklfirst,
+    _decode_str,
+    _decode_strfirst,
 )
 
 
@@ -30,20 +34,44 @@ class DirectRedis(Redis):
     of complex data types.
     """
 
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        *,
+        max_connections: int = 32,
+        timeout: Optional[float] = 5,
+        **kwargs: Any,
+    ) -> "DirectRedis":
+        """Return a DirectRedis client backed by a bounded blocking
+        connection pool created from ``url``.
+
+        A single client built this way can be shared across threads or
+        workers: at most ``max_connections`` sockets are ever opened, and
+        when all of them are busy a caller waits up to ``timeout`` seconds
+        for one to free up instead of growing the connection count without
+        bound. Any further keyword arguments (``db``, ``socket_timeout``,
+        ...) are forwarded to the pool and apply to every connection it
+        creates."""
+        pool = BlockingConnectionPool.from_url(
+            url, max_connections=max_connections, timeout=timeout, **kwargs
+        )
+        return cls(connection_pool=pool)
+
     def keys(self, pattern: str = "*", **kwargs: Any) -> List[str]:
         """Get all keys matching pattern."""
-        encoded = super().keys(pattern, **kwargs)
-        return [convert_get_type(key, pickle_first=False) for key in encoded or []]
+        encoded = Redis.keys(self, pattern, **kwargs)
+        return list(map(bytes.decode, encoded or ()))
 
     def randomkey(self, **kwargs: Any) -> Optional[str]:
         """Return a random key from the keyspace."""
-        encoded = super().randomkey(**kwargs)
-        return convert_get_type(encoded, pickle_first=False)
+        encoded = Redis.randomkey(self, **kwargs)
+        return _decode_str(encoded)
 
     def type(self, name: str) -> Optional[str]:
         """Determine the type stored at key."""
-        encoded = super().type(name)
-        return convert_get_type(encoded, pickle_first=False)
+        encoded = Redis.type(self, name)
+        return _decode_str(encoded)
 
     def set(
         self,
@@ -55,11 +83,11 @@ class DirectRedis(Redis):
         xx: bool = False,
     ) -> bool:
         """Set the value at key ``name`` to ``value``"""
-        return super().set(name, convert_set_type(value), ex, px, nx, xx)
+        return Redis.set(self, name, convert_set_type(value), ex, px, nx, xx)
 
     def get(self, name: str, pickle_first: bool = False) -> Any:
         """Return the value at key ``name``, or None if the key doesn't exist"""
-        encoded = super().get(name)
+        encoded = Redis.get(self, name)
         return convert_get_type(encoded, pickle_first)
 
     def mset(self, mapping: Dict[str, Any]) -> bool:
@@ -67,17 +95,53 @@ class DirectRedis(Redis):
         if not isinstance(mapping, dict):
             raise ValueError("mapping must be a python dictionary")
         mapping = convert_set_mapping_dic(mapping)
-        return super().mset(mapping)
+        return Redis.mset(self, mapping)
 
     def mget(self, *names: str, pickle_first: bool = False) -> List[Any]:
-        """Returns a list of values ordered identically to ``names``"""
-        encoded = super().mget(names)
-        return [convert_get_type(value, pickle_first) for value in encoded or []]
+        """Returns a list of values ordered identically to ``names``
+
+        Accepts either ``mget('a', 'b')`` or ``mget(['a', 'b'])``, like
+        redis-py itself."""
+        if len(names) == 1 and isinstance(names[0], (list, tuple)):
+            names = names[0]
+        encoded = Redis.mget(self, names)
+        return _batch_decode(encoded, pickle_first)
+
+    def mset_pipelined(self, mapping: Dict[str, Any], chunk_size: int = 1000) -> bool:
+        """Set key/values based on a mapping, sending MSET commands in
+        pipelined chunks of ``chunk_size`` items.
+
+        For very large mappings this amortizes round-trips and lets the
+        socket stay busy while later chunks are still being encoded."""
+        if not isinstance(mapping, dict):
+            raise ValueError("mapping must be a python dictionary")
+        items = list(mapping.items())
+        pipe = Redis.pipeline(self, transaction=False)
+        for start in range(0, len(items), chunk_size):
+            chunk = dict(items[start : start + chunk_size])
+            pipe.mset(convert_set_mapping_dic(chunk))
+        pipe.execute()
+        return True
+
+    def mget_pipelined(
+        self, names: List[str], chunk_size: int = 1000, pickle_first: bool = False
+    ) -> List[Any]:
+        """Returns a list of values ordered identically to ``names``,
+        fetched with MGET commands in pipelined chunks of ``chunk_size``
+        keys per round-trip."""
+        names = list(names)
+        pipe = Redis.pipeline(self, transaction=False)
+        for start in range(0, len(names), chunk_size):
+            pipe.mget(names[start : start + chunk_size])
+        decoded: List[Any] = []
+        for encoded in pipe.execute():
+            decoded.extend(_batch_decode(encoded, pickle_first))
+        return decoded
 
     def hkeys(self, name: str) -> List[str]:
         """Return the list of keys within hash ``name``"""
-        encoded = super().hkeys(name)
-        return [convert_get_type(key, pickle_first=False) for key in encoded or []]
+        encoded = Redis.hkeys(self, name)
+        return list(map(bytes.decode, encoded or ()))
 
     def hset(
         self,
@@ -89,8 +153,8 @@ class DirectRedis(Redis):
         """Set ``key`` to ``value`` within hash ``name``"""
         if mapping:
             mapping = convert_set_mapping_dic(mapping)
-            return super().hset(name, mapping=mapping)
-        return super().hset(name, key, convert_set_type(value))
+            return Redis.hset(self, name, mapping=mapping)
+        return Redis.hset(self, name, key, convert_set_type(value))
 
     def hmset(self, name: str, mapping: Dict[str, Any]) -> bool:
         """Set key to value within hash ``name``
@@ -98,115 +162,112 @@ class DirectRedis(Redis):
         if not isinstance(mapping, dict):
             raise ValueError("mapping must be a python dictionary")
         mapping = convert_set_mapping_dic(mapping)
-        return super().hmset(name, mapping)
+        return Redis.hmset(self, name, mapping)
 
     def hget(self, name: str, key: str, pickle_first: bool = False) -> Any:
         """Return the value of ``key`` within the hash ``name``"""
-        encoded = super().hget(name, key)
+        encoded = Redis.hget(self, name, key)
         return convert_get_type(encoded, pickle_first)
 
     def hmget(
         self, name: str, keys: List[str], pickle_first: bool = False
     ) -> List[Any]:
         """Returns a list of values ordered identically to ``keys``"""
-        encoded = super().hmget(name, keys)
-        return [convert_get_type(value, pickle_first) for value in encoded or []]
+        encoded = Redis.hmget(self, name, keys)
+        return _batch_decode(encoded, pickle_first)
 
     def hvals(self, name: str, pickle_first: bool = False) -> List[Any]:
         """Return the list of values within hash ``name``"""
-        encoded = super().hvals(name)
-        return [convert_get_type(value, pickle_first) for value in encoded or []]
+        encoded = Redis.hvals(self, name)
+        return _batch_decode(encoded, pickle_first)
 
     def hgetall(self, name: str, pickle_first: bool = False) -> Dict[str, Any]:
         """Return a Python dict of the hash's name/value pairs"""
-        encoded = super().hgetall(name)
-        return {
-            k.decode("utf-8"): convert_get_type(v, pickle_first)
-            for k, v in encoded.items()
-        }
+        encoded = Redis.hgetall(self, name)
+        if not encoded:
+            return {}
+        keys = map(bytes.decode, encoded.keys())
+        decoder = _decode_pklfirst if pickle_first else _decode_strfirst
+        return dict(zip(keys, map(decoder, encoded.values())))
 
     def sadd(self, name: str, *values: Any) -> int:
         """Add ``value(s)`` to set ``name``"""
-        encoded = [convert_set_type(value) for value in values]
-        return super().sadd(name, *encoded)
+        return Redis.sadd(self, name, *map(convert_set_type, values))
 
     def srem(self, name: str, *values: Any) -> int:
         """Remove ``values`` from set ``name``"""
-        encoded = [convert_set_type(value) for value in values]
-        return super().srem(name, *encoded)
+        return Redis.srem(self, name, *map(convert_set_type, values))
 
     def sismember(self, name: str, value: Any) -> bool:
         """Return a boolean indicating if ``value`` is a member of set ``name``"""
         encoded = convert_set_type(value)
-        return super().sismember(name, encoded)
+        return Redis.sismember(self, name, encoded)
 
     def smembers(self, name: str, pickle_first: bool = False) -> set:
         """Return all members of the set ``name``"""
-        encoded = super().smembers(name)
-        return {convert_get_type(value, pickle_first) for value in encoded or []}
+        encoded = Redis.smembers(self, name)
+        return set(_batch_decode(encoded, pickle_first))
 
     def spop(
         self, name: str, count: Optional[int] = None, pickle_first: bool = False
     ) -> Union[Any, List[Any]]:
         """Remove and return a random member of set ``name``"""
-        encoded = super().spop(name, count)
+        encoded = Redis.spop(self, name, count)
         if isinstance(encoded, list):
-            return [convert_get_type(value, pickle_first) for value in encoded]
+            return _batch_decode(encoded, pickle_first)
         return convert_get_type(encoded, pickle_first)
 
     def srandmember(
         self, name: str, number: Optional[int] = None, pickle_first: bool = False
     ) -> Union[Any, List[Any]]:
         """Return a random member of set ``name``"""
-        encoded = super().srandmember(name, number=number)
+        encoded = Redis.srandmember(self, name, number=number)
         if isinstance(encoded, list):
-            return [convert_get_type(value, pickle_first) for value in encoded or []]
+            return _batch_decode(encoded, pickle_first)
         return convert_get_type(encoded, pickle_first)
 
     def sdiff(self, keys: Union[str, List[str]], *args: str) -> set:
         """Return the difference of sets specified by ``keys``"""
-        encoded = super().sdiff(keys, *args)
-        return {convert_get_type(value, pickle_first=False) for value in encoded or []}
+        encoded = Redis.sdiff(self, keys, *args)
+        return set(_batch_decode(encoded, pickle_first=False))
 
     def lpush(self, name: str, *values: Any) -> int:
         """Push ``values`` onto the head of the list ``name``"""
-        encoded = [convert_set_type(value) for value in values]
-        return super().lpush(name, *encoded)
+        return Redis.lpush(self, name, *map(convert_set_type, values))
 
     def lpushx(self, name: str, value: Any) -> int:
         """Push ``value`` onto the head of the list ``name`` if ``name`` exists"""
-        return super().lpushx(name, convert_set_type(value))
+        return Redis.lpushx(self, name, convert_set_type(value))
 
     def rpushx(self, name: str, value: Any) -> int:
         """Push ``value`` onto the tail of the list ``name`` if ``name`` exists"""
-        return super().rpushx(name, convert_set_type(value))
+        return Redis.rpushx(self, name, convert_set_type(value))
 
     def rpush(self, name: str, *values: Any) -> int:
         """Push ``values`` onto the tail of the list ``name``"""
-        encoded = [convert_set_type(value) for value in values]
-        return super().rpush(name, *encoded)
+        return Redis.rpush(self, name, *map(convert_set_type, values))
 
     def lpop(
         self, name: str, count: Optional[int] = None, pickle_first: bool = False
     ) -> Union[Any, List[Any]]:
         """Remove and return the first item of the list ``name``"""
-        encoded = super().lpop(name, count)
+        encoded = Redis.lpop(self, name, count)
         if isinstance(encoded, list):
-            return [convert_get_type(value, pickle_first) for value in encoded]
+            return _batch_decode(encoded, pickle_first)
         return convert_get_type(encoded, pickle_first)
 
     def rpop(
         self, name: str, count: Optional[int] = None, pickle_first: bool = False
     ) -> Union[Any, List[Any]]:
         """Remove and return the last item of the list ``name``"""
-        encoded = super().rpop(name, count)
+        encoded = Redis.rpop(self, name, count)
         if isinstance(encoded, list):
-            return [convert_get_type(value, pickle_first) for value in encoded]
+            return _batch_decode(encoded, pickle_first)
         return convert_get_type(encoded, pickle_first)
 
     def lindex(self, name: str, index: int, pickle_first: bool = False) -> Any:
         """Return the item from list ``name`` at position ``index``"""
-        encoded = super().lindex(name, index)
+        encoded = Redis.lindex(self, name, index)
         return convert_get_type(encoded, pickle_first)
 
     def lrange(
@@ -219,5 +280,5 @@ class DirectRedis(Redis):
         ``start`` and ``end`` can be negative numbers just like
         Python slicing notation
         """
-        encoded = super().lrange(name, start, end)
-        return [convert_get_type(value, pickle_first) for value in encoded or []]
+        encoded = Redis.lrange(self, name, start, end)
+        return _batch_decode(encoded, pickle_first)
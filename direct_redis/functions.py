@@ -5,11 +5,135 @@ This module provides functions for data type conversion, serialization,
 and deserialization to be used with Redis.
 """
 
-import struct
+import io
+import math
 import pickle
+import threading
+from functools import partial
+
 import numpy as np
 
-__all__ = ["convert_set_type", "convert_set_mapping_dic", "convert_get_type"]
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__all__ = [
+    "convert_set_type",
+    "convert_set_mapping_dic",
+    "convert_get_type",
+    "set_compression",
+]
+
+# Pickle protocol 5 (Python 3.8+) is pinned explicitly so the stored
+# format does not drift with the interpreter's default.
+_pickle_dumps = partial(pickle.dumps, protocol=5)
+
+# One-byte tags prepended to serialized payloads so that convert_get_type
+# can dispatch on the first byte instead of guessing the codec.
+# Plain strings are stored untagged as raw UTF-8; each tag is a byte that
+# can never start a valid UTF-8 sequence (0xC0/0xC1 and 0xF5-0xFF are not
+# lead bytes), so a tagged payload can never be confused with a string.
+PICKLE_TAG = b"\xc0"
+MSGPACK_TAG = b"\xc1"
+JSON_TAG = b"\xf5"
+ZSTD_TAG = b"\xf6"
+NPY_TAG = b"\xf7"
+
+if msgspec is not None:
+    _msgpack_encode = msgspec.msgpack.Encoder().encode
+    _msgpack_decode = msgspec.msgpack.Decoder().decode
+
+
+def _missing_codec_decoder(package):
+    """Return a decoder stub that raises for values whose codec is not
+    installed on the reading side, rather than handing back raw bytes."""
+
+    def _raise(payload):
+        raise ImportError(
+            f"This value was serialized with {package}, which is not installed. "
+            f"Please install it using pip install {package}"
+        )
+
+    return _raise
+
+
+# Tag byte -> decoder for the payload that follows it. Every known tag
+# gets an entry: either the real decoder, or a stub that raises an
+# informative ImportError when the optional codec is missing, so a
+# reader never mistakes a tagged payload for an untagged one.
+_TAG_DECODERS = {PICKLE_TAG[0]: pickle.loads}
+if msgspec is not None:
+    _TAG_DECODERS[MSGPACK_TAG[0]] = _msgpack_decode
+else:
+    _TAG_DECODERS[MSGPACK_TAG[0]] = _missing_codec_decoder("msgspec")
+if orjson is not None:
+    _TAG_DECODERS[JSON_TAG[0]] = orjson.loads
+else:
+    _TAG_DECODERS[JSON_TAG[0]] = _missing_codec_decoder("orjson")
+
+# Transparent zstd compression of large serialized payloads. Disabled by
+# default; enable it with set_compression(). Compression contexts are
+# kept per thread because zstandard objects are not thread-safe.
+_compression_enabled = False
+_compression_threshold = 1024
+_zstd_contexts = threading.local()
+
+if zstandard is not None:
+
+    def _zstd_compress(blob):
+        compressor = getattr(_zstd_contexts, "compressor", None)
+        if compressor is None:
+            compressor = _zstd_contexts.compressor = zstandard.ZstdCompressor(level=1)
+        return compressor.compress(blob)
+
+    def _zstd_decode(payload):
+        decompressor = getattr(_zstd_contexts, "decompressor", None)
+        if decompressor is None:
+            decompressor = _zstd_contexts.decompressor = zstandard.ZstdDecompressor()
+        blob = decompressor.decompress(payload)
+        decoder = _TAG_DECODERS.get(blob[0])
+        if decoder is None:
+            raise ValueError(
+                "unknown codec tag 0x%02x inside a compressed payload" % blob[0]
+            )
+        return decoder(blob[1:])
+
+    _TAG_DECODERS[ZSTD_TAG[0]] = _zstd_decode
+else:
+    _TAG_DECODERS[ZSTD_TAG[0]] = _missing_codec_decoder("zstandard")
+
+
+def set_compression(enabled, threshold=1024):
+    """
+    Enable or disable transparent zstd compression of serialized values.
+
+    When enabled, any serialized payload larger than ``threshold`` bytes
+    is compressed with zstd level 1 before being sent to Redis, trading a
+    little CPU for less network transfer and Redis memory. Values written
+    while compression was off remain readable either way.
+
+    :param enabled: Whether to compress large payloads
+    :param threshold: Minimum serialized size in bytes to compress
+    :raises ImportError: If zstandard is not installed
+    """
+    global _compression_enabled, _compression_threshold
+    if enabled and zstandard is None:
+        raise ImportError(
+            "zstandard is not installed. Please install it using pip install zstandard"
+        )
+    _compression_enabled = enabled
+    _compression_threshold = threshold
 
 
 def isinstances(obj, classinfos: list):
@@ -23,91 +147,292 @@ def isinstances(obj, classinfos: list):
     return any(isinstance(obj, c) for c in classinfos)
 
 
-def convert_set_type(value):
+_EXACT_SCALARS = frozenset({int, float, bool, str, bytes, type(None)})
+
+
+def _msgpack_exact(value, _scalars=_EXACT_SCALARS):
+    """Return True when msgpack round-trips ``value`` with every type
+    intact: scalars plus lists and dicts thereof. Tuples, sets, and
+    subclasses are msgpack-encodable but come back as something else, so
+    anything containing them must stay on pickle."""
+    t = type(value)
+    if t in _scalars:
+        return True
+    if t is list:
+        return all(map(_msgpack_exact, value))
+    if t is dict:
+        return all(map(_msgpack_exact, value.keys())) and all(
+            map(_msgpack_exact, value.values())
+        )
+    return False
+
+
+def _json_exact(value, _isfinite=math.isfinite):
+    """Like :func:`_msgpack_exact` for orjson: JSON additionally rules
+    out bytes, non-string dict keys, and non-finite floats (orjson would
+    write NaN/inf as null)."""
+    t = type(value)
+    if t is float:
+        return _isfinite(value)
+    if t in (int, bool, str, type(None)):
+        return True
+    if t is list:
+        return all(map(_json_exact, value))
+    if t is dict:
+        for key in value:
+            if type(key) is not str:
+                return False
+        return all(map(_json_exact, value.values()))
+    return False
+
+
+def _encode_object(value):
+    """Serialize a non-string value behind its codec tag: msgpack (or
+    orjson when msgspec is unavailable) when the value round-trips
+    exactly, pickle otherwise. Large payloads are zstd-compressed when
+    enabled."""
+    blob = None
+    if msgspec is not None:
+        try:
+            if _msgpack_exact(value):
+                blob = MSGPACK_TAG + _msgpack_encode(value)
+        except (OverflowError, RecursionError, msgspec.EncodeError):
+            pass  # e.g. ints beyond 64 bits or absurdly deep nesting
+    elif orjson is not None:
+        try:
+            if _json_exact(value):
+                blob = JSON_TAG + orjson.dumps(value)
+        except (TypeError, RecursionError, orjson.JSONEncodeError):
+            pass
+    if blob is None:
+        blob = PICKLE_TAG + _pickle_dumps(value)
+    if _compression_enabled and len(blob) > _compression_threshold:
+        return ZSTD_TAG + _zstd_compress(blob)
+    return blob
+
+
+# Exact-type dispatch table consulted before the generic encode path.
+# A single dict lookup on type(value) replaces the isinstance checks and,
+# for types msgpack can never fail on, the try/except as well. Strings
+# are encoded to UTF-8 here so redis-py's connection layer can send the
+# bytes as-is instead of re-encoding them per command.
+_ENCODERS = {str: str.encode}
+
+if msgspec is not None:
+
+    def _encode_msgpack(value):
+        return MSGPACK_TAG + _msgpack_encode(value)
+
+    for _infallible_type in (float, bytes):
+        _ENCODERS[_infallible_type] = _encode_msgpack
+
+# Pre-encoded constants: flags, counters and sentinels recur so often
+# that even one codec call per write is worth skipping. Their encoded
+# form is deterministic, so the blobs can be shared freely. The caches
+# are keyed by bool or int only - unlike arbitrary values, those are
+# always hashable, so the lookups can never raise.
+_NONE_ENCODED = _encode_object(None)
+_BOOL_ENCODED = {True: _encode_object(True), False: _encode_object(False)}
+_SMALL_INT_ENCODED = {i: _encode_object(i) for i in range(-1, 2)}
+
+
+def _encode_bool(value, _cache=_BOOL_ENCODED):
+    return _cache[value]
+
+
+def _encode_none(value, _none=_NONE_ENCODED):
+    return _none
+
+
+def _encode_int(value, _cache=_SMALL_INT_ENCODED, _default=_encode_object):
+    cached = _cache.get(value)
+    if cached is not None:
+        return cached
+    return _default(value)
+
+
+_ENCODERS[bool] = _encode_bool
+_ENCODERS[type(None)] = _encode_none
+_ENCODERS[int] = _encode_int
+
+
+def convert_set_type(value, _encoders=_ENCODERS, _default=_encode_object):
     """
     Convert a value to a format suitable for storing in Redis.
 
+    Strings become raw UTF-8 bytes; everything else is serialized with
+    msgpack when possible (fast C codec, compact wire format) and with
+    pickle otherwise, each behind its one-byte tag.
+
     :param value: The value to convert
-    :return: Converted value (string or serialized object)
+    :return: Converted value (raw UTF-8 or tagged serialized bytes)
     """
-    if isinstance(value, str):
-        return value
-    return pickle.dumps(value)
+    encoder = _encoders.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    return _default(value)
 
 
-def convert_set_mapping_dic(dic):
+def convert_set_mapping_dic(dic, _convert=convert_set_type):
     """
     Convert all values in a dictionary to a format suitable for storing in Redis.
 
+    Keys and converted values flow through C-level zip/map iterators into
+    a single dict() call rather than a per-item comprehension frame.
+
     :param dic: The dictionary to convert
     :return: Converted dictionary
     """
-    return {k: convert_set_type(v) for k, v in dic.items()}
+    return dict(zip(dic.keys(), map(_convert, dic.values())))
 
 
-def convert_get_type(encoded, pickle_first):
+def _decode_strfirst(encoded, _decoders_get=_TAG_DECODERS.get):
     """
-    Convert an encoded value retrieved from Redis back to its original type.
+    Decode a value retrieved from Redis, preferring the string reading.
 
-    :param encoded: The encoded value
-    :param pickle_first: Whether to attempt pickle deserialization first
-    :return: Converted value
+    The hot path is one index into the tag table via a pre-bound
+    ``dict.get``, dropping straight into the relevant C decoder.
+    Untagged payloads are a plain UTF-8 string, or a value written by an
+    older direct_redis version that pickled without a tag byte. Pickle
+    protocol 2+ always starts with 0x80, which can never begin a valid
+    UTF-8 string, so one integer compare replaces a doomed decode attempt
+    and its exception unwind.
     """
     if encoded is None:
         return None
+    if not encoded:
+        return ""
 
-    if pickle_first:
+    tag_decoder = _decoders_get(encoded[0])
+    if tag_decoder is not None:
+        return tag_decoder(encoded[1:])
+
+    if encoded[0] == 0x80:
         try:
             return pickle.loads(encoded)
-        except pickle.PickleError:
+        except (pickle.PickleError, ValueError, EOFError):
             pass
 
     try:
         return encoded.decode("utf-8")
     except UnicodeDecodeError:
-        if not pickle_first:
-            try:
-                return pickle.loads(encoded)
-            except pickle.PickleError:
-                pass
+        pass
+
+    try:
+        return pickle.loads(encoded)
+    except (pickle.PickleError, ValueError, EOFError):
+        return encoded
 
-    return encoded
+
+def _decode_pklfirst(encoded, _decoders_get=_TAG_DECODERS.get):
+    """
+    Decode a value retrieved from Redis, attempting pickle before UTF-8.
+
+    Same dispatch as :func:`_decode_strfirst`, for ambiguous untagged
+    payloads whose pickled form happens to also be valid UTF-8.
+    """
+    if encoded is None:
+        return None
+    if not encoded:
+        return ""
+
+    tag_decoder = _decoders_get(encoded[0])
+    if tag_decoder is not None:
+        return tag_decoder(encoded[1:])
+
+    try:
+        return pickle.loads(encoded)
+    except (pickle.PickleError, ValueError, EOFError):
+        pass
+
+    try:
+        return encoded.decode("utf-8")
+    except UnicodeDecodeError:
+        return encoded
+
+
+def convert_get_type(encoded, pickle_first):
+    """
+    Convert an encoded value retrieved from Redis back to its original type.
+
+    :param encoded: The encoded value
+    :param pickle_first: Whether to attempt pickle deserialization first
+    :return: Converted value
+    """
+    if pickle_first:
+        return _decode_pklfirst(encoded)
+    return _decode_strfirst(encoded)
+
+
+def _decode_str(encoded):
+    """
+    Decode a key name retrieved from Redis.
+
+    Key names are always plain strings on the wire, so this skips the
+    codec dispatch and fallback chain of :func:`convert_get_type`.
+
+    :param encoded: The encoded key name, or None
+    :return: Decoded string, or None
+    """
+    if encoded is None:
+        return None
+    return encoded.decode("utf-8")
+
+
+def _batch_decode(encoded_values, pickle_first):
+    """
+    Decode every value in an iterable retrieved from Redis.
+
+    Picks the specialized decoder once up front and runs the loop through
+    ``map``, so the bulk read wrappers evaluate neither the pickle_first
+    branch nor any attribute lookup per element.
+
+    :param encoded_values: Iterable of encoded values (may be None or empty)
+    :param pickle_first: Whether to attempt pickle deserialization first
+    :return: List of decoded values
+    """
+    if not encoded_values:
+        return []
+    decoder = _decode_pklfirst if pickle_first else _decode_strfirst
+    return list(map(decoder, encoded_values))
 
 
 def serialize_np(np_array):
     """
-    Serialize a NumPy array.
+    Serialize a NumPy array using NumPy's native ``.npy`` format.
+
+    The header and buffer are written in one C-level pass, any
+    dimensionality and dtype are supported, and pickle is never involved.
 
     :param np_array: The NumPy array to serialize
     :return: Serialized byte string
-    :raises ValueError: If the array has unsupported dimensions
     """
-    shape = np_array.shape
-    if len(shape) == 1:
-        d1, d2, d3 = shape[0], 0, 0
-    elif len(shape) == 2:
-        d1, d2, d3 = shape[0], shape[1], 0
-    elif len(shape) == 3:
-        d1, d2, d3 = shape
-    else:
-        raise ValueError("Redis can only store 1D, 2D, and 3D NumPy arrays.")
-
-    dtype = np_array.dtype.num
-    packed_data = struct.pack(">IIII", dtype, d1, d2, d3)
-    return packed_data + np_array.tobytes()
+    buffer = io.BytesIO()
+    np.lib.format.write_array(buffer, np.asarray(np_array), allow_pickle=False)
+    return buffer.getvalue()
 
 
 def unserialize_np(encoded):
     """
-    Deserialize a serialized NumPy array.
+    Deserialize a NumPy array serialized by :func:`serialize_np`.
 
     :param encoded: The serialized NumPy array
     :return: Deserialized NumPy array
     """
-    dtype, d1, d2, d3 = struct.unpack(">IIII", encoded[:16])
-    np_array = np.frombuffer(encoded, offset=16, dtype=np.typeDict[dtype])
-    if d3 != 0:
-        return np_array.reshape(d1, d2, d3)
-    if d2 != 0:
-        return np_array.reshape(d1, d2)
-    return np_array
+    return np.lib.format.read_array(io.BytesIO(encoded), allow_pickle=False)
+
+
+def _encode_ndarray(np_array):
+    """Serialize an ndarray behind its tag via the .npy path, falling back
+    to the generic codec for arrays .npy cannot hold (object dtype)."""
+    try:
+        return NPY_TAG + serialize_np(np_array)
+    except ValueError:
+        return _encode_object(np_array)
+
+
+# NumPy arrays bypass pickle entirely: the .npy framing is written in one
+# C-level pass on the way in, where pickling an ndarray copies its buffer
+# twice, and read_array reconstructs it directly on the way out.
+_ENCODERS[np.ndarray] = _encode_ndarray
+_TAG_DECODERS[NPY_TAG[0]] = unserialize_np